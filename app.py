@@ -1,24 +1,54 @@
 from __future__ import annotations 
 import tkinter as tk 
-from tkinter import ttk, messagebox 
-import random 
-from dataclasses import dataclass, field 
-from typing import Dict, List, Tuple, Optional, Set
+from tkinter import ttk, messagebox
+from tkinter import font as tkfont
+import heapq
+import random
+import time as _time
+from collections import OrderedDict, deque
+from math import hypot
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Tuple, Optional
 
 
 # ------------- Model -------------
 
-@dataclass
+def _ek(u: str, v: str) -> Tuple[str, str]:
+    """Normalized undirected edge key - a branch instead of tuple(sorted(...))."""
+    return (u, v) if u <= v else (v, u)
+
+
+NODE_BASE_RADIUS = 20 # Base draw radius; scaled by node weight
+
+
+@dataclass(slots=True)
 class Node:
     name: str
-    x: int 
-    y: int 
-    weight: float = 1.0 # Represents importance, capacity , or traffic 
-    canvas_id: Optional[int] = None 
-    label_id: Optional[int] = None 
-    
+    x: int
+    y: int
+    weight: float = 1.0 # Represents importance, capacity , or traffic
+    canvas_id: Optional[int] = None
+    label_id: Optional[int] = None
+    glow_ids: Tuple[int, int, int] = (0, 0, 0) # Canvas ids of the three glow ovals
+    _radius: int = field(init=False, repr=False, default=NODE_BASE_RADIUS)
+    _bbox: Tuple[int, int, int, int] = field(init=False, repr=False, default=(0, 0, 0, 0))
+
+    def __post_init__(self):
+        self._recompute_geometry()
+
+    def set_weight(self, weight: float) -> None:
+        """Update weight and the cached draw radius/bbox together."""
+        self.weight = weight
+        self._recompute_geometry()
+
+    def _recompute_geometry(self) -> None:
+        r = int(NODE_BASE_RADIUS * self.weight)
+        self._radius = r
+        self._bbox = (self.x - r, self.y - r, self.x + r, self.y + r)
+
+
     
-@dataclass 
+@dataclass(slots=True)
 class Edge:
     u: str
     v: str
@@ -26,19 +56,61 @@ class Edge:
     time: float = 1.0 
     accessible: bool = True 
     closed: bool = False 
-    line_id: Optional[int] = None 
-    label_id: Optional[int] = None 
-    
+    line_id: Optional[int] = None
+    label_id: Optional[int] = None
+    # label midpoint, cached by Graph when the edge is created (endpoints
+    # never move afterwards)
+    _mid: Tuple[float, float] = field(init=False, repr=False, default=(0.0, 0.0))
+
+
     def key(self) -> Tuple[str, str]:
-        return tuple(sorted((self.u, self.v)))
+        return (self.u, self.v) if self.u <= self.v else (self.v, self.u)
     
     
 class Graph:
+    """Undirected campus graph.
+
+    Besides the node/edge dicts, the graph maintains derived structures so
+    searches never scan all edges: an adjacency cache (self.adj) updated on
+    every mutation, plus lazily rebuilt per-version indexes for traversal
+    and connected components. Anything that can affect a route must call
+    mark_dirty() so those caches refresh.
+    """
+
+    PATH_CACHE_MAX = 256 # Cap on memoized search results
+
     def __init__(self) -> None:
         self.nodes: Dict[str, Node] = {}
-        # store undirected edges by normalized pair key 
-        self.edges: Dict[Tuple[str, str], Edge] = {} # Store connections between buildings 
-        
+        # store undirected edges by normalized pair key
+        self.edges: Dict[Tuple[str, str], Edge] = {} # Store connections between buildings
+        # adjacency cache: building name -> [(neighbor name, Edge), ...]
+        # kept in sync by add/delete so neighbors() is O(degree) not O(E)
+        self.adj: Dict[str, List[Tuple[str, Edge]]] = {}
+        # topology version + memoized search results; repeat queries on an
+        # unchanged graph become O(1) dict hits instead of a full traversal
+        self._version: int = 0
+        self._path_cache: "OrderedDict[tuple, Tuple[List[str], List[str], float, float]]" = OrderedDict()
+        # dense integer index over nodes, rebuilt lazily per topology version
+        # (see _ensure_index); traversals run on small ints + a bitset
+        self._index_version: int = -1
+        self._idx_of: Dict[str, int] = {}
+        self._name_of: List[str] = []
+        self._adj_ids: List[List[Tuple[int, Edge]]] = []
+        self._acc_end: List[int] = [] # Per node: count of accessible entries (they sort first)
+        # lazily labelled connected components (see _ensure_components)
+        self._components: Dict[str, int] = {}
+        self._components_version: int = -1
+        # lazily built repaint list of (node, node, edge) triples
+        self._draw_list: List[Tuple[Node, Node, Edge]] = []
+        self._draw_list_version: int = -1
+        # A* heuristic scale (meters per pixel), set by _ensure_index
+        self._h_scale: float = 1.0
+
+    def mark_dirty(self) -> None:
+        """Invalidate cached search results after any change affecting routes."""
+        self._version += 1
+        self._path_cache.clear()
+
     # ----- node ops -----
     def add_node(self, name: str, x: int, y: int) -> None:
         """Add a new building to the campus map."""
@@ -47,6 +119,8 @@ class Graph:
         if name in self.nodes:
             raise ValueError(f"Duplicate building name '{name}'.")
         self.nodes[name] = Node(name=name, x=int(x), y=int(y))
+        self.adj[name] = []
+        self.mark_dirty()
         
     def delete_node(self, name: str) -> int:
         """Delete a building and all its connections. Returns number of edges deleted."""
@@ -61,9 +135,15 @@ class Graph:
                 
         for key in edges_to_delete:
             del self.edges[key]
-            
+
+        # Drop this node's adjacency entries and the mirror entries on neighbors
+        for nbr, _ in self.adj[name]:
+            self.adj[nbr] = [(n, e) for n, e in self.adj[nbr] if n != name]
+        del self.adj[name]
+
         # Delete the node
         del self.nodes[name]
+        self.mark_dirty()
         return len(edges_to_delete)
         
     # ----- edge ops -----
@@ -73,62 +153,440 @@ class Graph:
             raise ValueError("Cannot connect a building to itself.")
         if u not in self.nodes or v not in self.nodes:
             raise ValueError("Both buildings must exist.")
-        # Using sorted tuple as a key so direction doesn't matter (undirected graph)
-        key = tuple(sorted((u, v)))
+        # Using a normalized pair key so direction doesn't matter (undirected graph)
+        key = _ek(u, v)
         if key in self.edges:
             raise ValueError(f"An edge between '{u}' and '{v}' already exists.")
         if distance <= 0 or time <= 0:
             raise ValueError("Distance and time must be positive numbers.")
-        self.edges[key] = Edge(u=u, v=v, distance=float(distance), time=float(time), accessible=bool(accessible))
+        e = Edge(u=u, v=v, distance=float(distance), time=float(time), accessible=bool(accessible))
+        n1, n2 = self.nodes[u], self.nodes[v]
+        e._mid = ((n1.x + n2.x) / 2, (n1.y + n2.y) / 2)
+        self.edges[key] = e
+        # Keep the adjacency cache in sync (both directions of the undirected edge)
+        self.adj[u].append((v, e))
+        self.adj[v].append((u, e))
+        self.mark_dirty()
      
      
     def delete_edge(self, u: str, v: str) -> None:
-        """Delete a connection between two buildings."""   
-        key = tuple(sorted((u, v)))
+        """Delete a connection between two buildings."""
+        key = _ek(u, v)
         if key not in self.edges:
             raise ValueError(f"No connection exists between '{u}' and '{v}'.")
         del self.edges[key]
+        a, b = key
+        self.adj[a] = [(n, e) for n, e in self.adj[a] if n != b]
+        self.adj[b] = [(n, e) for n, e in self.adj[b] if n != a]
+        self.mark_dirty()
         
     def neighbors(self, name: str, accessible_only: bool) -> List[str]:
-        """Get all buildings connected to this one."""
-        nbrs = []
-        for (a,b), e in self.edges.items():
-            # Skip closed paths 
-            if e.closed:
-                continue
-            # Skip non-accessible if in accessible-only mode 
-            if accessible_only and not e.accessible:
-                continue
-            # Add the other building to neighbors list 
-            if a == name:
-                nbrs.append(b)
-            elif b == name:
-                nbrs.append(a)
-        return nbrs
-        
-    def get_edge(self, a: str, b: str) -> Optional[Edge]: 
-        return self.edges.get(tuple(sorted((a, b))))
+        """Get all buildings connected to this one (O(degree) via the adjacency cache)."""
+        # Skip closed paths, and non-accessible ones in accessible-only mode
+        return [n for n, e in self.adj.get(name, [])
+                if not e.closed and (not accessible_only or e.accessible)]
+        
+    def get_edge(self, a: str, b: str) -> Optional[Edge]:
+        return self.edges.get(_ek(a, b))
     
     def all_edge_keys(self) -> List[Tuple[str, str]]:
         return list(self.edges.keys())
     
     def randomize_weights(self) -> None:
         """Randomize distance/time within sensible ranges."""
-        for e in self.edges.values():
-            # Distance in meters (or arbitrary units), Time in minutes (arbitrary)
-            e.distance = round(random.uniform(50, 500), 1)
-            e.time = round(random.uniform(1, 10), 1)
+        # Generate both batches up front in comprehensions (the stdlib
+        # stand-in for a vectorized rng.uniform(lo, hi, size=m)), then
+        # zip-assign onto the edges
+        r = random.random
+        m = len(self.edges)
+        # Distance in meters (or arbitrary units), Time in minutes (arbitrary)
+        dists = [round(50 + r() * 450, 1) for _ in range(m)]
+        times = [round(1 + r() * 9, 1) for _ in range(m)]
+        for e, d, t in zip(self.edges.values(), dists, times):
+            e.distance = d
+            e.time = t
+        self.mark_dirty()
             
-    def randomize_node_Weights(self) -> None:
+    def randomize_node_weights(self) -> None:
         """Randomize node weights representing importance/capacity/ traffic."""
-        for node in self.nodes.values():
-            # Weight from 0.5 to 3.0 (affects visual size)
-            node.weight = round(random.uniform(0.5, 3.0), 1)
-            
+        r = random.random
+        # Weight from 0.5 to 3.0 (affects visual size), batched like the
+        # edge randomizer
+        weights = [round(0.5 + r() * 2.5, 1) for _ in range(len(self.nodes))]
+        for node, w in zip(self.nodes.values(), weights):
+            node.set_weight(w)
+        self.mark_dirty()
+
+    def bulk_load(self, nodes: List[Tuple[str, int, int]],
+                  edges: List[Tuple[str, str, float, float, bool]]) -> None:
+        """Load a whole campus in one pass - fast path for startup/sample maps.
+
+        Skips the per-call duplicate and existence checks of
+        add_node/add_edge; callers are trusted to pass consistent data.
+        """
+        self.nodes = {name: Node(name=name, x=int(x), y=int(y)) for name, x, y in nodes}
+        self.adj = {name: [] for name in self.nodes}
+        self.edges = {}
+        for u, v, dist, time, acc in edges:
+            key = _ek(u, v)
+            e = Edge(u=u, v=v, distance=float(dist), time=float(time), accessible=bool(acc))
+            n1, n2 = self.nodes[u], self.nodes[v]
+            e._mid = ((n1.x + n2.x) / 2, (n1.y + n2.y) / 2)
+            self.edges[key] = e
+            self.adj[u].append((v, e))
+            self.adj[v].append((u, e))
+        self.mark_dirty()
+
+    # ----- pathfinding -----
+    def _ensure_index(self) -> None:
+        """(Re)build the dense integer node index when the topology changed.
+
+        Searches operate on small ints with a Python-int bitset for
+        'visited' (bit i set = node i seen) instead of hashing building-name
+        strings on every step; names are restored only for the final output.
+        """
+        if self._index_version == self._version:
+            return
+        self._idx_of = {name: i for i, name in enumerate(self.nodes)}
+        self._name_of = list(self.nodes)
+        idx_of = self._idx_of
+        # Partition each adjacency list so accessible edges come first and
+        # remember the boundary; accessible-only searches then iterate just
+        # the head slice and skip the accessibility check entirely
+        self._adj_ids = []
+        self._acc_end = []
+        for name in self._name_of:
+            entries = sorted(((idx_of[w], e) for w, e in self.adj[name]),
+                             key=lambda we: not we[1].accessible)
+            self._adj_ids.append(entries)
+            self._acc_end.append(sum(1 for _, e in entries if e.accessible))
+        # A* admissibility scale: edge distances are meters but coordinates
+        # are canvas pixels, so a raw straight-line heuristic can
+        # overestimate and break optimality. Scaling by the tightest
+        # meters-per-pixel ratio over all edges (capped at 1.0) keeps the
+        # heuristic a guaranteed underestimate
+        scale = 1.0
+        nodes = self.nodes
+        for e in self.edges.values():
+            n1, n2 = nodes[e.u], nodes[e.v]
+            d = hypot(n1.x - n2.x, n1.y - n2.y)
+            if d > 0.0:
+                r = e.distance / d
+                if r < scale:
+                    scale = r
+        self._h_scale = scale
+        self._index_version = self._version
+
+    def _ensure_components(self) -> None:
+        """Lazily label connected components after a topology change.
+
+        Labels ignore closed/accessible flags, so they form a superset of
+        what any search can reach: differing labels prove there is no path,
+        letting find_path answer unreachable queries in O(1).
+        """
+        if self._components_version == self._version:
+            return
+        comp: Dict[str, int] = {}
+        label = 0
+        for name in self.nodes:
+            if name in comp:
+                continue
+            comp[name] = label
+            stack = [name]
+            while stack:
+                u = stack.pop()
+                for w, _ in self.adj[u]:
+                    if w not in comp:
+                        comp[w] = label
+                        stack.append(w)
+            label += 1
+        self._components = comp
+        self._components_version = self._version
+
+    def edge_draw_list(self) -> List[Tuple[Node, Node, Edge]]:
+        """Endpoint-resolved (node, node, edge) triples for repainting.
+
+        Rebuilt lazily when the graph version changes, so a full repaint
+        iterates already-unpacked triples instead of probing the node dict
+        twice per edge.
+        """
+        if self._draw_list_version != self._version:
+            nodes = self.nodes
+            self._draw_list = [(nodes[e.u], nodes[e.v], e)
+                               for e in self.edges.values()]
+            self._draw_list_version = self._version
+        return self._draw_list
+
+    def find_path(self, algo: str, start: str, goal: str, accessible_only: bool) -> Tuple[List[str], List[str], float, float]:
+        """Run a search, memoizing results until the graph changes.
+
+        Returns (visited_order, path, total_distance, total_time); the
+        totals are accumulated from the edges walked during the search, so
+        callers never re-fetch path edges. Results are keyed by (algo,
+        start, goal, accessible_only, version); mark_dirty() bumps the
+        version so stale entries can never match.
+        """
+        if start not in self.nodes or goal not in self.nodes:
+            return [], [], 0.0, 0.0
+
+        # Trivial and provably-unreachable queries skip the traversal entirely
+        if start == goal:
+            return [start], [start], 0.0, 0.0
+        self._ensure_components()
+        if self._components[start] != self._components[goal]:
+            return [start], [], 0.0, 0.0
+
+        key = (algo, start, goal, accessible_only, self._version)
+        cached = self._path_cache.get(key)
+        if cached is not None:
+            self._path_cache.move_to_end(key) # Keep recently used entries alive
+            return cached
+
+        if algo == "BFS":
+            result = self._bfs(start, goal, accessible_only)
+        elif algo == "DFS":
+            result = self._dfs(start, goal, accessible_only)
+        else: # "DIJK" or "ASTAR"
+            result = self._dijkstra(start, goal, accessible_only,
+                                    use_heuristic=(algo == "ASTAR"))
+
+        self._path_cache[key] = result
+        if len(self._path_cache) > self.PATH_CACHE_MAX:
+            self._path_cache.popitem(last=False) # Evict oldest
+        return result
+
+    def _bfs(self, start: str, goal: str, accessible_only: bool):
+        """
+        Breadth-First Search - finds shortest path by hop count.
+        Explores level by level using a deque (O(1) popleft).
+        """
+        self._ensure_index()
+        name_of = self._name_of
+        adj = self._adj_ids
+        acc_end = self._acc_end
+        s, g = self._idx_of[start], self._idx_of[goal]
+
+        q = deque([s]) # Queue for BFS - FIFO
+        parent: Dict[int, Optional[int]] = {s: None} # Trakc path for reconstruction
+        parent_edge: Dict[int, Edge] = {} # Edge that reached each building
+        visited = 1 << s # Bitset of visited buildings
+        visited_order: List[int] = [] # Order we visited buildings for the output
+
+        # Local-bind the bound methods used every iteration; CPython resolves
+        # attribute lookups per call, and this loop is the hot path
+        q_popleft = q.popleft
+        q_append = q.append
+        order_append = visited_order.append
+
+        while q:
+            u = q_popleft() # Get next building fom front of queue
+            order_append(u)
+
+            # Found the destination
+            if u == g:
+                break
+
+            # Walk this building's adjacency entries directly - in accessible
+            # mode only the accessible head slice, so no per-edge
+            # accessibility branch is needed at all
+            for w, e in (adj[u][:acc_end[u]] if accessible_only else adj[u]):
+                # Skip closed paths
+                if e.closed:
+                    continue
+                # If we heaven't visited this building yet
+                bit = 1 << w
+                if not visited & bit:
+                    visited |= bit
+                    parent[w] = u # Remembering how we got here
+                    parent_edge[w] = e
+                    q_append(w) # Add to queue to explore later
+
+
+        # Build the final path start to goal, mapping ids back to names
+        path = self._reconstruct_path(parent, s, g)
+        total_dist, total_time = self._path_totals(path, parent_edge)
+        return ([name_of[i] for i in visited_order],
+                [name_of[i] for i in path], total_dist, total_time)
+
+    def _dfs(self, start: str, goal: str, accessible_only: bool):
+        """
+        Depth-First Search - explores as far as possible before backtracking.
+        Uses an explicit stack instead of recursion, so deep graphs can't
+        hit Python's recursion limit (and skip per-call frame overhead).
+        """
+        self._ensure_index()
+        name_of = self._name_of
+        adj = self._adj_ids
+        acc_end = self._acc_end
+        s, g = self._idx_of[start], self._idx_of[goal]
+
+        visited = 1 << s # Bitset of visited buildings
+        visited_order: List[int] = [s]
+        parent: Dict[int, Optional[int]] = {s: None}
+        parent_edge: Dict[int, Edge] = {} # Edge that reached each building
+        found = s == g # Flag to stop once e find the goal
+
+        # Stack of (node, iterator over its remaining neighbors): each entry
+        # resumes exactly where it left off, matching the recursive
+        # exploration order without Python call frames per node
+        stack: List[Tuple[int, Iterator[Tuple[int, Edge]]]] = [
+            (s, iter(adj[s][:acc_end[s]] if accessible_only else adj[s]))
+        ]
+        # Same local-binding treatment as the BFS hot loop
+        stack_append = stack.append
+        stack_pop = stack.pop
+        order_append = visited_order.append
+
+        while stack and not found:
+            u, it = stack[-1]
+            for w, e in it:
+                # Skip closed paths
+                if e.closed:
+                    continue
+                bit = 1 << w
+                if visited & bit:
+                    continue
+                visited |= bit
+                parent[w] = u
+                parent_edge[w] = e
+                order_append(w)
+
+                # Check if we reached the goal
+                if w == g:
+                    found = True
+                    break
+
+                # Go deep: descend into this neighbor before u's others
+                stack_append((w, iter(adj[w][:acc_end[w]] if accessible_only else adj[w])))
+                break
+            else:
+                stack_pop() # u's neighbors exhausted - backtrack
+
+        # Build the path if we found one, mapping ids back to names
+        path = self._reconstruct_path(parent, s, g) if found else []
+        total_dist, total_time = self._path_totals(path, parent_edge)
+        return ([name_of[i] for i in visited_order],
+                [name_of[i] for i in path], total_dist, total_time)
+
+    def _dijkstra(self, start: str, goal: str, accessible_only: bool,
+                  use_heuristic: bool = False):
+        """
+        Dijkstra - true shortest path by total distance on weighted edges,
+        O((V+E) log V) with a binary heap and lazy decrease-key (stale heap
+        entries are skipped when popped).
+
+        With use_heuristic the straight-line distance to the goal is added
+        as an A* priority, pruning most of the frontier. It is multiplied
+        by _h_scale - the tightest meters-per-pixel ratio over all edges -
+        so the heuristic never overestimates and A* stays optimal.
+        """
+        self._ensure_index()
+        name_of = self._name_of
+        adj = self._adj_ids
+        acc_end = self._acc_end
+        s, g = self._idx_of[start], self._idx_of[goal]
+
+        if use_heuristic:
+            gx, gy = self.nodes[goal].x, self.nodes[goal].y
+            nodes_by_id = [self.nodes[n] for n in name_of]
+            h_scale = self._h_scale # Keeps pixel distances admissible
+            h_cache = [-1.0] * len(name_of) # Heuristic memo; nodes relax repeatedly
+
+        dist: Dict[int, float] = {s: 0.0}
+        parent: Dict[int, Optional[int]] = {s: None}
+        parent_edge: Dict[int, Edge] = {} # Edge that reached each building
+        settled = 0 # Bitset of finalized buildings
+        visited_order: List[int] = []
+
+        counter = 0 # Tie-breaker so the heap never compares nodes
+        heap = [(0.0, counter, s)]
+        while heap:
+            f, _, u = heapq.heappop(heap)
+            bit = 1 << u
+            if settled & bit:
+                continue # Stale entry - already settled with a shorter route
+            settled |= bit
+            visited_order.append(u)
+
+            # Found the destination with its final distance
+            if u == g:
+                break
+
+            du = dist[u]
+            for w, e in (adj[u][:acc_end[u]] if accessible_only else adj[u]):
+                # Skip closed paths
+                if e.closed:
+                    continue
+                nd = du + e.distance
+                if nd < dist.get(w, float("inf")):
+                    dist[w] = nd
+                    parent[w] = u
+                    parent_edge[w] = e
+                    if use_heuristic:
+                        h = h_cache[w]
+                        if h < 0.0:
+                            n = nodes_by_id[w]
+                            h = h_cache[w] = h_scale * hypot(n.x - gx, n.y - gy)
+                        f = nd + h
+                    else:
+                        f = nd
+                    counter += 1
+                    heapq.heappush(heap, (f, counter, w))
+
+        # Build the path if the goal was settled, mapping ids back to names
+        path = self._reconstruct_path(parent, s, g) if settled & (1 << g) else []
+        total_dist, total_time = self._path_totals(path, parent_edge)
+        return ([name_of[i] for i in visited_order],
+                [name_of[i] for i in path], total_dist, total_time)
+
+    def _reconstruct_path(self, parent: Dict, start, goal) -> List:
+        """Trace back from goal to start using parent pointers to build the path.
+
+        Works on whatever node handles the caller used (names or integer ids).
+        """
+        if goal not in parent:
+            return[] # No path exists
+
+        # First pass: count the hops so the list is allocated exactly once
+        n = 1
+        cur = goal
+        while parent[cur] is not None:
+            cur = parent[cur]
+            n += 1
+
+        # Second pass: fill back-to-front - no appends, no reverse()
+        path: List = [None] * n
+        cur = goal
+        i = n - 1
+        while cur is not None:
+            path[i] = cur
+            i -= 1
+            cur = parent[cur]
+
+        # Verify path starts at the right place
+        return path if path[0] == start else []
+
+    @staticmethod
+    def _path_totals(path: List, parent_edge: Dict) -> Tuple[float, float]:
+        """Sum distance/time along a reconstructed path using the edges the
+        search already fetched - no get_edge lookups after the fact."""
+        total_dist = total_time = 0.0
+        for i in path[1:]:
+            e = parent_edge[i]
+            total_dist += e.distance
+            total_time += e.time
+        return total_dist, total_time
+
            
  # ------------- GUI Controller/Views -------------                
 class App(tk.Tk):
     NODE_RADIUS = 20
+    ANIM_TICK_MS = 16 # Animation cadence (~60 fps)
+    ANIM_BUDGET_S = 0.012 # Max time spent drawing path segments per tick
+    # Level-of-detail cutoffs: above these sizes, decorative glow rings and
+    # edge distance labels are skipped to keep the item count manageable
+    LOD_NODE_THRESHOLD = 150
+    LOD_EDGE_THRESHOLD = 150
      
     # Color Palette with hex codes 
     COLOR_PRIMARY = "#E3B1F6"
@@ -163,19 +621,44 @@ class App(tk.Tk):
     COLOR_EDGE_CLOSED = "#ef4444"
     COLOR_EDGE_NONACC = "#f59e0b"
     COLOR_PATH_HILITE = "#22c55e"
-    
+
+    # Style tables indexed by (closed << 1) | (not accessible) so the draw
+    # loop does plain lookups instead of branching per edge
+    EDGE_COLORS = (COLOR_EDGE_OPEN, COLOR_EDGE_NONACC, COLOR_EDGE_CLOSED, COLOR_EDGE_CLOSED)
+    EDGE_WIDTHS = (2, 2, 3, 3)
+    EDGE_DASHES = ((), (), (5, 3), (5, 3))
+    # Combined (color, width, dash) triples - one index, one tuple unpack
+    EDGE_STYLES = tuple(zip(EDGE_COLORS, EDGE_WIDTHS, EDGE_DASHES))
+
     
     def __init__(self):
         super().__init__()
-        self.title("🎓 Interactive Campus Navigation (BFS & DFS)")
+        self.title("🎓 Interactive Campus Navigation (BFS, DFS, Dijkstra & A*)")
         # Compact window size 
         self.geometry("1320x780")
         self.minsize(1150, 680)
         self.configure(bg=self.COLOR_BG_DARK)
         
+        # Pre-created font objects - Tk stores these by name, so repeated
+        # canvas calls skip re-parsing ('Segoe UI', ...) tuples per item
+        self.font_edge_label = tkfont.Font(family='Segoe UI', size=8)
+        self.font_node_label = tkfont.Font(family='Segoe UI', size=9, weight='bold')
+
         self.graph = Graph()
         self.mode_place_node: bool = False
         self.pending_node_name: Optional[str] = None
+
+        # listbox row -> edge key mapping, rebuilt only by _refresh_edge_list
+        # so click handlers don't re-sort all edges on every click
+        self._edge_index: List[Tuple[str, str]] = []
+        self._node_index: List[str] = [] # listbox row -> building name, same idea
+        # last rendered listbox rows, so refreshes only touch changed lines
+        self._last_edge_rows: List[str] = []
+        self._last_node_rows: List[str] = []
+        self._last_combo_names: Tuple[str, ...] = ()
+        self._ui_refresh_pending: bool = False
+        self._redraw_pending: bool = False
+        self._cull_pending: bool = False
         
         # traversal animation state
         self.anim_steps: List[Tuple[str, str]] = [] # sequence of (from, to) edges being traversed
@@ -297,9 +780,6 @@ class App(tk.Tk):
             ("Admin Building", 520, 600)
         ]
         
-        for name, x, y in buildings:
-            self.graph.add_node(name, x, y)
-            
         # Add pathways (edges) between buildings 
         # Format: (from, to, distance_meters, time_minutes, accessible)
         pathways = [
@@ -337,28 +817,28 @@ class App(tk.Tk):
             ("Parking A", "Science Lab", 420, 6.0, True),
         ]
         
-        for u, v, dist, time, acc in pathways:
-            self.graph.add_edge(u, v, dist, time, acc)
-            
-        # Draw initial graph 
-        self._redraw_all()
-        self._refresh_node_lists()
-        self._refresh_edge_list()
+        # Bulk-load everything in one pass instead of ~33 guarded inserts
+        self.graph.bulk_load(buildings, pathways)
+
+        # Draw initial graph
+        self._request_redraw()
+        self._schedule_ui_refresh()
         
     def _toggle_edge_accessible(self):
         sel = self.listbox_edges.curselection()
         if not sel:
             messagebox.showwarning("No Selection", "Select an edge from the list.")
             return 
-        keys = sorted(self.graph.edges.keys())
         idx = sel[0]
-        if idx >= len(keys):
+        if idx >= len(self._edge_index):
             return
-        keys = keys[idx]
-        e = self.graph.edges[keys]
+        key = self._edge_index[idx]
+        e = self.graph.edges[key]
         e.accessible = not e.accessible
-        self._redraw_all()
-        self._refresh_edge_list()
+        self.graph.mark_dirty()
+        self._clear_highlights() # The shown path may ride this edge
+        self._update_edge_item(e)
+        self._update_edge_row(idx, key, e)
         
         
         
@@ -377,7 +857,7 @@ class App(tk.Tk):
         title.pack(side=tk.LEFT, padx=20, pady=12)
         
         subtitle = tk.Label(header,
-                            text="Intelligent Pathfinding • BFS & DFS",
+                            text="Intelligent Pathfinding • BFS, DFS, Dijkstra & A*",
                             font=('Segoe UI', 10),
                             bg=self.COLOR_PRIMARY,
                             fg=self.COLOR_TEXT_SECONDARY)
@@ -401,9 +881,9 @@ class App(tk.Tk):
                                 scrollregion=(0, 0, 1000, 900)) # Define scrollable area 
         
         
-        # Add scrollbars 
-        h_scrollbar = tk.Scrollbar(left, orient=tk.HORIZONTAL, command=self.canvas.xview)
-        v_scrollbar = tk.Scrollbar(left, orient=tk.VERTICAL, command=self.canvas.yview)
+        # Add scrollbars (wrapped so panning re-evaluates viewport culling)
+        h_scrollbar = tk.Scrollbar(left, orient=tk.HORIZONTAL, command=self._canvas_xview)
+        v_scrollbar = tk.Scrollbar(left, orient=tk.VERTICAL, command=self._canvas_yview)
         
         self.canvas.configure(xscrollcommand=h_scrollbar.set, yscrollcommand=v_scrollbar.set)
         
@@ -431,13 +911,24 @@ class App(tk.Tk):
         canvas_scroll.create_window((0, 0), window=scroll_frame, anchor="nw", width=330)
         canvas_scroll.configure(yscrollcommand=scrollbar.set)
         
-        # Enable mousewheel scrolling 
+        # Enable mousewheel scrolling
         def _on_mousewheel(event):
             canvas_scroll.yview_scroll(int(-1*(event.delta/120)), "units")
-            
-        canvas_scroll.bind_all("<MouseWheel>", _on_mousewheel) # Windows/Mac
-        canvas_scroll.bind_all("<Button-4>", lambda e: canvas_scroll.yview_scroll(-1, "units")) # Linux up
-        canvas_scroll.bind_all("<Button-5>", lambda e: canvas_scroll.yview_scroll(1, "units")) # Linux down
+
+        # Only capture global wheel events while the pointer is over the
+        # control panel, so the rest of the app never pays for the callback
+        def _bind_wheel(_event=None):
+            canvas_scroll.bind_all("<MouseWheel>", _on_mousewheel) # Windows/Mac
+            canvas_scroll.bind_all("<Button-4>", lambda e: canvas_scroll.yview_scroll(-1, "units")) # Linux up
+            canvas_scroll.bind_all("<Button-5>", lambda e: canvas_scroll.yview_scroll(1, "units")) # Linux down
+
+        def _unbind_wheel(_event=None):
+            canvas_scroll.unbind_all("<MouseWheel>")
+            canvas_scroll.unbind_all("<Button-4>")
+            canvas_scroll.unbind_all("<Button-5>")
+
+        canvas_scroll.bind("<Enter>", _bind_wheel)
+        canvas_scroll.bind("<Leave>", _unbind_wheel)
         
         canvas_scroll.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
@@ -449,7 +940,7 @@ class App(tk.Tk):
         self._create_card(scroll_frame, "🔗 Connect Buildings",
                           self._build_edge_section)
         
-        self._create_card(scroll_frame, "🔍 Find Path (BFS/DFS)",
+        self._create_card(scroll_frame, "🔍 Find Path (BFS/DFS/Dijkstra/A*)",
                   self._building_pathfinding)
         
         self._create_card(scroll_frame, "⚡ Manage Buildings",
@@ -689,6 +1180,18 @@ class App(tk.Tk):
         ttk.Button(btn_frame,
                    text="DFS",
                    command=lambda: self._run_search("DFS")).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(4, 0))
+
+        # Weighted shortest-path algorithms
+        btn_frame2 = tk.Frame(parent, bg=self.COLOR_BG_CARD)
+        btn_frame2.pack(fill=tk.X, pady=(4, 0))
+
+        ttk.Button(btn_frame2,
+                   text="Dijkstra",
+                   command=lambda: self._run_search("DIJK")).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 4))
+
+        ttk.Button(btn_frame2,
+                   text="A*",
+                   command=lambda: self._run_search("ASTAR")).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(4, 0))
         
     def _build_output(self, parent):
         text_frame = tk.Frame(parent, bg=self.COLOR_BG_INPUT)
@@ -737,7 +1240,77 @@ class App(tk.Tk):
                     font=('Segoe UI', 8)).pack(side=tk.LEFT, padx=(4, 0))  # Smaller font 
                 
     def _bind_events(self):
-        self.canvas.bind("<Button-1>", self._on_canvas_click)
+        # <Button-1> is bound by _start_place_node only while placing, so
+        # ordinary clicks on the map cost no Python callback at all
+        # Resize and wheel events arrive in bursts, so they go through the
+        # debounced cull rather than re-culling per event
+        self.canvas.bind("<Configure>", self._request_cull)
+        self.canvas.bind("<MouseWheel>", self._on_map_wheel) # Windows/Mac
+        self.canvas.bind("<Button-4>", lambda e: self._on_map_wheel(e, -1)) # Linux up
+        self.canvas.bind("<Button-5>", lambda e: self._on_map_wheel(e, 1)) # Linux down
+
+    def _on_map_wheel(self, event, direction: Optional[int] = None):
+        """Scroll the map vertically with the wheel, then re-cull so
+        newly-exposed regions get their items flipped back to visible."""
+        if direction is None:
+            direction = int(-1 * (event.delta / 120))
+        self.canvas.yview_scroll(direction, "units")
+        self._request_cull()
+
+    def _canvas_xview(self, *args):
+        self.canvas.xview(*args)
+        self._request_cull()
+
+    def _canvas_yview(self, *args):
+        self.canvas.yview(*args)
+        self._request_cull()
+
+    def _request_cull(self, _event=None):
+        """Debounced visibility pass: a drag on the scrollbar or a window
+        resize fires many events per frame, but only one cull runs per
+        event-loop tick."""
+        if self._cull_pending:
+            return
+        self._cull_pending = True
+        self.after_idle(self._do_cull)
+
+    def _do_cull(self):
+        self._cull_pending = False
+        self._cull_viewport()
+
+    def _cull_viewport(self, _event=None):
+        """Hide items fully outside the visible canvas area.
+
+        Tk skips 'hidden' items when painting, so panning a large map only
+        pays for what is on screen; items are flipped back to 'normal' when
+        they scroll into view. No items are created or destroyed.
+        """
+        c = self.canvas
+        w, h = c.winfo_width(), c.winfo_height()
+        if w <= 1: # Not mapped yet
+            return
+        vx0, vy0 = c.canvasx(0), c.canvasy(0)
+        vx1, vy1 = vx0 + w, vy0 + h
+        m = self.NODE_RADIUS + 15 # Margin covering glow rings and labels
+
+        for node in self.graph.nodes.values():
+            x0, y0, x1, y1 = node._bbox
+            visible = (x1 >= vx0 - m and x0 <= vx1 + m
+                       and y1 >= vy0 - m and y0 <= vy1 + m)
+            state = 'normal' if visible else 'hidden'
+            for item in (node.canvas_id, node.label_id, *node.glow_ids):
+                if item:
+                    c.itemconfigure(item, state=state)
+
+        nodes = self.graph.nodes
+        for e in self.graph.edges.values():
+            n1, n2 = nodes[e.u], nodes[e.v]
+            visible = not (max(n1.x, n2.x) < vx0 or min(n1.x, n2.x) > vx1
+                           or max(n1.y, n2.y) < vy0 or min(n1.y, n2.y) > vy1)
+            state = 'normal' if visible else 'hidden'
+            for item in (e.line_id, e.label_id):
+                if item:
+                    c.itemconfigure(item, state=state)
             
     def _on_canvas_click(self, event):
         if not self.mode_place_node:
@@ -756,9 +1329,10 @@ class App(tk.Tk):
             self.graph.add_node(name, int(x), int(y))
             self.entry_node_name.delete(0, tk.END)
             self.mode_place_node = False
+            self.canvas.unbind("<Button-1>") # Placement done - stop listening
             self.btn_place_node.config(text="📍 Click to Place") # Match shorter text
-            self._redraw_all()
-            self._refresh_node_lists()
+            self._draw_node(self.graph.nodes[name]) # Draw only the new building
+            self._schedule_ui_refresh()
         except ValueError as e:
             messagebox.showerror("Error", str(e))
                 
@@ -769,7 +1343,8 @@ class App(tk.Tk):
             return 
             
         self.mode_place_node = True
-        self.btn_place_node.config(text="🎯 Click Now")  # Even shorter for active state 
+        self.canvas.bind("<Button-1>", self._on_canvas_click) # Listen only while placing
+        self.btn_place_node.config(text="🎯 Click Now")  # Even shorter for active state
             
             
     def _add_edge(self):
@@ -792,104 +1367,218 @@ class App(tk.Tk):
             
         try:
             self.graph.add_edge(u, v, dist, time, accessible)
-            self._redraw_all()
-            self._refresh_edge_list()
+            # Draw only the new edge and tuck the line under the node ovals
+            e = self.graph.get_edge(u, v)
+            self._draw_edge(e)
+            self.canvas.tag_lower(e.line_id)
+            self._schedule_ui_refresh()
         except ValueError as e:
             messagebox.showerror("Error", str(e))
                 
+    def _schedule_ui_refresh(self):
+        """Coalesce node/edge list refreshes to at most one per event-loop
+        tick - a burst of mutations pays for a single combobox/listbox
+        update instead of one per call."""
+        if self._ui_refresh_pending:
+            return
+        self._ui_refresh_pending = True
+        self.after_idle(self._flush_ui)
+
+    def _flush_ui(self):
+        self._ui_refresh_pending = False
+        self._refresh_node_lists()
+        self._refresh_edge_list()
+
     def _refresh_node_lists(self):
         names = sorted(self.graph.nodes.keys())
-        
-        # Update combo boxes
-        for combo in [self.combo_u, self.combo_v, self.combo_start, self.combo_goal]:
-            combo['values'] = names 
-            if names and not combo.get():
-                combo.current(0)
-                    
+        self._node_index = names
+
+        # Update combo boxes - only when the name set actually changed, so
+        # refreshes triggered by unrelated mutations (edge toggles, weight
+        # randomization) cost zero Tk round-trips here
+        names_tuple = tuple(names)
+        if names_tuple != self._last_combo_names:
+            self._last_combo_names = names_tuple
+            for combo in [self.combo_u, self.combo_v, self.combo_start, self.combo_goal]:
+                combo['values'] = names
+                if names and not combo.get():
+                    combo.current(0)
                     
-        # Update node listbox
-        self.listbox_nodes.delete(0, tk.END)   
-        for name in names:
-            node = self.graph.nodes[name]  
-            line = f"{name} (weight: {node.weight})"   
-            self.listbox_nodes.insert(tk.END, line)    
-            
                     
+        # Update node listbox (changed rows only)
+        rows = [f"{name} (weight: {self.graph.nodes[name].weight})" for name in names]
+        self._diff_listbox(self.listbox_nodes, self._last_node_rows, rows)
+        self._last_node_rows = rows
+
+
     def _refresh_edge_list(self):
-        self.listbox_edges.delete(0, tk.END)
-        for (a, b), e in sorted(self.graph.edges.items()):
-            status = "✓" if not e.closed else "✗"
-            acc = "♿" if e.accessible else "⚠️"
-            line = f"{status} {a}  ↔ {b} | {int(e.distance)}m, {e.time:.1f}min {acc}"
-            self.listbox_edges.insert(tk.END, line)
+        self._edge_index = sorted(self.graph.edges.keys())
+        edges = self.graph.edges
+        rows = [self._edge_row(key, edges[key]) for key in self._edge_index]
+        self._diff_listbox(self.listbox_edges, self._last_edge_rows, rows)
+        self._last_edge_rows = rows
+
+    @staticmethod
+    def _edge_row(key: Tuple[str, str], e: Edge) -> str:
+        """Format one edge-listbox row - shared by the full refresh and the
+        single-row toggle updates so the two can never drift apart."""
+        a, b = key
+        status = "✓" if not e.closed else "✗"
+        acc = "♿" if e.accessible else "⚠️"
+        return f"{status} {a}  ↔ {b} | {int(e.distance)}m, {e.time:.1f}min {acc}"
+
+    def _update_edge_row(self, idx: int, key: Tuple[str, str], e: Edge):
+        """Rewrite a single edge-listbox row in place - O(1) for a toggle
+        instead of scheduling a refresh that walks every row."""
+        row = self._edge_row(key, e)
+        self.listbox_edges.delete(idx)
+        self.listbox_edges.insert(idx, row)
+        self.listbox_edges.selection_set(idx) # delete() dropped the selection
+        if idx < len(self._last_edge_rows):
+            self._last_edge_rows[idx] = row
+
+    @staticmethod
+    def _diff_listbox(listbox, old_rows: List[str], new_rows: List[str]):
+        """Apply only the changed rows to a listbox instead of a full refill.
+
+        Single-row edits (the common case: one toggle) cost one delete+insert
+        rather than clearing and re-inserting every line."""
+        for i in range(min(len(old_rows), len(new_rows))):
+            if old_rows[i] != new_rows[i]:
+                listbox.delete(i)
+                listbox.insert(i, new_rows[i])
+        if len(new_rows) > len(old_rows):
+            for row in new_rows[len(old_rows):]:
+                listbox.insert(tk.END, row)
+        elif len(old_rows) > len(new_rows):
+            listbox.delete(len(new_rows), tk.END)
                 
+    def _request_redraw(self):
+        """Debounced full repaint: schedule _redraw_all at most once per
+        event-loop tick, so a batch of mutations (e.g. a future graph
+        import) pays for a single repaint. Use update_idletasks - never
+        update() - anywhere a forced refresh is needed."""
+        if self._redraw_pending:
+            return
+        self._redraw_pending = True
+        self.after_idle(self._do_redraw)
+
+    def _do_redraw(self):
+        self._redraw_pending = False
+        self._redraw_all()
+
     def _redraw_all(self):
+        """Full repaint - used on load and bulk changes. Single-item edits go
+        through _draw_edge/_draw_node/_update_edge_item instead of repainting
+        the whole canvas."""
         self.canvas.delete("all")
-            
-        # Draw edges first (so they're ebhind nodes)
-        for (a, b), e in self.graph.edges.items():
-            n1 = self.graph.nodes[a]
-            n2 = self.graph.nodes[b]
-                
-            # Determine color 
-            if e.closed:
-                color = self.COLOR_EDGE_CLOSED
-                width = 3
-                dash = (5, 3)
-            elif not e.accessible:
-                color = self.COLOR_EDGE_NONACC
-                width = 2
-                dash = None 
-            else:
-                color = self.COLOR_EDGE_OPEN
-                width = 2
-                dash = None 
-                    
-            # Draw edge
-            self.canvas.create_line(
-                n1.x, n1.y, n2.x, n2.y, 
-                fill=color,
-                width=width,
-                dash=dash
-            )
-                
-            # Draw distance label 
-            mid_x = (n1.x + n2.x) / 2
-            mid_y = (n1.y + n2.y) / 2
-            self.canvas.create_text(
-                mid_x, mid_y,
+
+        # Draw edges first (so they're ebhind nodes) - the draw list carries
+        # resolved endpoint nodes, so no dict probes inside the loop
+        for n1, n2, e in self.graph.edge_draw_list():
+            self._draw_edge(e, n1, n2)
+
+        # Draw nodes with glow effect
+        for node in self.graph.nodes.values():
+            self._draw_node(node)
+
+        # Hide whatever landed outside the viewport right away, so a bulk
+        # repaint of a large map never leaves offscreen items painting
+        self._cull_viewport()
+
+    def _edge_style(self, e: Edge) -> Tuple[str, int, Tuple[int, int]]:
+        """Pick (color, width, dash) for an edge from its closed/accessible state."""
+        return self.EDGE_STYLES[(e.closed << 1) | (0 if e.accessible else 1)]
+
+    def _draw_edge(self, e: Edge, n1: Optional[Node] = None, n2: Optional[Node] = None):
+        """Create the canvas items for one edge and remember their ids.
+
+        Callers that already hold the endpoint nodes pass them in; otherwise
+        they are looked up here.
+        """
+        if n1 is None:
+            n1 = self.graph.nodes[e.u]
+            n2 = self.graph.nodes[e.v]
+        color, width, dash = self._edge_style(e)
+
+        # Draw edge
+        e.line_id = self.canvas.create_line(
+            n1.x, n1.y, n2.x, n2.y,
+            fill=color,
+            width=width,
+            dash=dash
+        )
+
+        # Draw distance label (skipped above the LOD cutoff)
+        if len(self.graph.edges) < self.LOD_EDGE_THRESHOLD:
+            e.label_id = self.canvas.create_text(
+                *e._mid,
                 text=f"{int(e.distance)}m",
                 fill=self.COLOR_TEXT_MUTED,
-                font=('Segoe UI', 8)
+                font=self.font_edge_label
             )
-                
-        # Draw nodes with glow effect 
-        for name, node in self.graph.nodes.items():
-            x, y = node.x, node.y 
-            # Scale radius based on weight (0.5x to 3.0x the base size)
-            r = self.NODE_RADIUS
-                
-            # Glow layers (outer to inner)
-            glow_scale = node.weight * 0.8 # Slightly less glow scaling 
-            self.canvas.create_oval(x-r-10, y-r-10, x+r+10, y+r+10, 
-                                fill=self.COLOR_NODE_GLOW_1, outline='')
-            self.canvas.create_oval(x-r-6, y-r-6, x+r+6, y+r+6, 
-                                fill=self.COLOR_NODE_GLOW_2, outline='')
-            self.canvas.create_oval(x-r-3, y-r-3, x+r+3, y+r+3, 
-                                fill=self.COLOR_NODE_GLOW_3, outline='')
-            
-            # Main node
-            self.canvas.create_oval(x-r, y-r, x+r, y+r,
-                                    fill=self.COLOR_NODE, 
-                                    outline=self.COLOR_NODE_BORDER, 
-                                    width=2)
-                
-            # Label with weight indicator 
-            self.canvas.create_text(x, y+r+15, 
-                                    text=name,
-                                    fill=self.COLOR_TEXT_PRIMARY,
-                                    font=('Segoe UI', 9, 'bold'))
-                
+        else:
+            e.label_id = None
+
+    def _update_edge_item(self, e: Edge):
+        """Restyle an edge's existing canvas items in place - one itemconfigure
+        call instead of a full O(V+E) repaint."""
+        if e.line_id is None:
+            return
+        color, width, dash = self._edge_style(e)
+        self.canvas.itemconfigure(e.line_id, fill=color, width=width, dash=dash)
+
+    def _update_edge_label(self, e: Edge):
+        """Refresh an edge's distance label after its weight changed."""
+        if e.label_id is not None:
+            self.canvas.itemconfigure(e.label_id, text=f"{int(e.distance)}m")
+
+    def _draw_node(self, node: Node):
+        """Create the canvas items for one node and remember their ids."""
+        x, y = node.x, node.y
+        # Radius scaled by weight (0.5x to 3.0x the base size), cached on the node
+        r = node._radius
+
+        # Glow layers (outer to inner), created once and moved via coords
+        # later; skipped entirely above the LOD cutoff
+        if len(self.graph.nodes) < self.LOD_NODE_THRESHOLD:
+            node.glow_ids = (
+                self.canvas.create_oval(x-r-10, y-r-10, x+r+10, y+r+10,
+                                    fill=self.COLOR_NODE_GLOW_1, outline=''),
+                self.canvas.create_oval(x-r-6, y-r-6, x+r+6, y+r+6,
+                                    fill=self.COLOR_NODE_GLOW_2, outline=''),
+                self.canvas.create_oval(x-r-3, y-r-3, x+r+3, y+r+3,
+                                    fill=self.COLOR_NODE_GLOW_3, outline=''),
+            )
+        else:
+            node.glow_ids = (0, 0, 0)
+
+        # Main node (bbox precomputed alongside the radius)
+        node.canvas_id = self.canvas.create_oval(*node._bbox,
+                                fill=self.COLOR_NODE,
+                                outline=self.COLOR_NODE_BORDER,
+                                width=2)
+
+        # Label with weight indicator
+        node.label_id = self.canvas.create_text(x, y+r+15,
+                                text=node.name,
+                                fill=self.COLOR_TEXT_PRIMARY,
+                                font=self.font_node_label)
+
+    def _update_node_item(self, node: Node):
+        """Reposition/resize a node's existing canvas items in place - coords
+        updates are roughly 10x cheaper than recreating the ovals."""
+        if node.canvas_id is None:
+            return
+        x, y = node.x, node.y
+        r = node._radius
+        x0, y0, x1, y1 = node._bbox
+        for gid, k in zip(node.glow_ids, (10, 6, 3)):
+            if gid: # Glows may be absent above the LOD cutoff
+                self.canvas.coords(gid, x0-k, y0-k, x1+k, y1+k)
+        self.canvas.coords(node.canvas_id, x0, y0, x1, y1)
+        self.canvas.coords(node.label_id, x, y+r+15)
+
     def _toggle_edge_closed(self):
         sel = self.listbox_edges.curselection()
         if not sel:
@@ -897,14 +1586,15 @@ class App(tk.Tk):
             return 
             
         idx = sel[0]
-        keys = sorted(self.graph.edges.keys())
-        if idx >= len(keys):
-            return 
-        key = keys[idx]
+        if idx >= len(self._edge_index):
+            return
+        key = self._edge_index[idx]
         e = self.graph.edges[key]
         e.closed = not e.closed
-        self._redraw_all()
-        self._refresh_edge_list()
+        self.graph.mark_dirty()
+        self._clear_highlights() # The shown path may ride this edge
+        self._update_edge_item(e)
+        self._update_edge_row(idx, key, e)
         
     def _randomize_weights(self):
         """Randomize all edge distances and times"""
@@ -913,8 +1603,11 @@ class App(tk.Tk):
             return 
         
         self.graph.randomize_weights()
-        self._redraw_all()
-        self._refresh_edge_list()
+        self._clear_highlights() # Shown route/totals are stale under new weights
+        # Only the distance labels change - update them in place
+        for e in self.graph.edges.values():
+            self._update_edge_label(e)
+        self._schedule_ui_refresh()
         messagebox.showinfo("Sucess", "All edge weights have been randomized!")
         
     def _randomize_node_weights(self):
@@ -924,8 +1617,11 @@ class App(tk.Tk):
             return 
         
         self.graph.randomize_node_weights()
-        self._redraw_all()
-        self._refresh_node_lists()
+        self._clear_highlights() # Old rings wouldn't match the new radii
+        # New radii only move/resize existing items - no repaint needed
+        for node in self.graph.nodes.values():
+            self._update_node_item(node)
+        self._schedule_ui_refresh()
         messagebox.showinfo("Sucess", f"All {len(self.graph.nodes)} building weights have been randomized!")
         
     def _delete_edge(self):
@@ -936,20 +1632,25 @@ class App(tk.Tk):
             return
         
         idx = sel[0]
-        keys = sorted(self.graph.edges.keys())
-        if idx >= len(keys):
-            return 
-        
-        key = keys[idx]
-        a, b = key 
+        if idx >= len(self._edge_index):
+            return
+
+        key = self._edge_index[idx]
+        a, b = key
         
         # Confirm deletion 
         if messagebox.askyesno("Confirm Delete", 
                                f"Delete connection between '{a}' and '{b}'?"):
             try:
+                e = self.graph.get_edge(a, b)
                 self.graph.delete_edge(a, b)
-                self._redraw_all()
-                self._refresh_Edge_list()
+                self._clear_highlights() # The shown path may ride this edge
+                # Remove only this edge's canvas items
+                if e.line_id is not None:
+                    self.canvas.delete(e.line_id)
+                if e.label_id is not None:
+                    self.canvas.delete(e.label_id)
+                self._schedule_ui_refresh()
                 messagebox.showinfo("Success", "Connection deleted!")
             except ValueError as e:
                 messagebox.showerror("Error", str(e))
@@ -962,14 +1663,13 @@ class App(tk.Tk):
             return
         
         idx = sel[0]
-        names = sorted(self.graph.nodes.keys())
-        if idx >= len(names):
+        if idx >= len(self._node_index):
             return
+
+        name = self._node_index[idx]
         
-        name = names[idx]
-        
-        # Check how many edges will be deleted 
-        edge_count = sum(1 for key in self.graph.edges.keys() if name in key)
+        # Check how many edges will be deleted - O(degree) via the adjacency cache
+        edge_count = len(self.graph.adj.get(name, ()))
         
         # Confirm deletion 
         msg = f"Delete building '{name}'?"
@@ -977,11 +1677,18 @@ class App(tk.Tk):
             msg += f"\n\nThis will also delete {edge_count} connection(s)."
             
         if messagebox.askyesno("Confirm Delete", msg):
-            try: 
+            try:
+                # Collect canvas items to remove before the graph mutates
+                node = self.graph.nodes[name]
+                doomed = [node.canvas_id, node.label_id, *node.glow_ids]
+                for _, e in self.graph.adj[name]:
+                    doomed.extend((e.line_id, e.label_id))
                 deleted_edges = self.graph.delete_node(name)
-                self._redraw_all()
-                self._refresh_node_lists()
-                self._refresh_edge_list()
+                self._clear_highlights() # The shown path may pass through here
+                for item in doomed:
+                    if item:
+                        self.canvas.delete(item)
+                self._schedule_ui_refresh()
                 messagebox.showinfo("Success", 
                                     f"Deleted '{name}' and {deleted_edges} connection(s)!")
             except ValueError as e:
@@ -989,7 +1696,7 @@ class App(tk.Tk):
                 
                           
     def _run_search(self, mode: str):
-        """Execute BFS or DFS search and animate the result"""
+        """Execute the selected search (BFS/DFS/Dijkstra/A*) and animate the result"""
         # Doesn't start new search if animation is running 
         if self.animating:
             return 
@@ -1006,16 +1713,14 @@ class App(tk.Tk):
             messagebox.showwarning("Same Node", "Start and goal are the same.")
             return
             
-        # run the selected algorithm 
+        # run the selected algorithm (memoized on the graph until it changes)
         accessible_only = self.var_accessible_only.get()
-        if mode == "BFS":
-            visited_order, path = self._bfs(start, goal, accessible_only)
-        else:
-            visited_order, path = self._dfs(start, goal, accessible_only)
-                
-                
+        visited_order, path, total_dist, total_time = self.graph.find_path(
+            mode, start, goal, accessible_only)
+
+
         # Show results
-        self._print_result(mode, visited_order, path)
+        self._print_result(mode, visited_order, path, total_dist, total_time)
         if not path:
             messagebox.showinfo("No Path", f"No path found between '{start}' and '{goal}'.")
             return 
@@ -1028,162 +1733,69 @@ class App(tk.Tk):
                 
         # Set up animation 
         self.anim_steps = [(path[i], path[i+1]) for i in range(len(path) - 1)]
-        self.active_path = path 
-        self.anim_index = 0 
-        self.animating = True 
-        self._redraw_all()
+        self.active_path = path
+        self.anim_index = 0
+        self.animating = True
+        self.canvas.delete("anim") # Drop old highlights; base items persist
         self._animate_step()
             
     def _animate_step(self):
-        if self.anim_index >= len(self.anim_steps):
-            self.animating = False 
-            return 
-            
-        a, b = self.anim_steps[self.anim_index]
-        e = self.graph.get_edge(a, b)
-        if e:
-            n1, n2 = self.graph.nodes[a], self.graph.nodes[b]
-                
-            # Draw thick highlighted path
-            self.canvas.create_line(
-                n1.x, n1.y, n2.x, n2.y,
-                fill=self.COLOR_SUCCESS,
-                smooth=True
-            )
-                
-            # Highlight nodes
-            r = self.NODE_RADIUS
-            for node in [n1, n2]:
-                self.canvas.create_oval(
-                    node.x - r - 2, node.y - r - 2,
-                    node.x + r + 2, node.y + r + 2,
-                    outline=self.COLOR_PATH_HILITE,
-                    width=3, 
-                    fill=''
+        """Draw pending path segments in batches: as many as fit inside the
+        per-tick time budget, then yield to the event loop - one idle
+        callback per batch instead of one timer per edge."""
+        t0 = _time.perf_counter()
+        while (self.anim_index < len(self.anim_steps)
+               and _time.perf_counter() - t0 < self.ANIM_BUDGET_S):
+            a, b = self.anim_steps[self.anim_index]
+            e = self.graph.get_edge(a, b)
+            if e:
+                n1, n2 = self.graph.nodes[a], self.graph.nodes[b]
+
+                # Draw thick highlighted path
+                self.canvas.create_line(
+                    n1.x, n1.y, n2.x, n2.y,
+                    fill=self.COLOR_SUCCESS,
+                    smooth=True,
+                    tags="anim"
                 )
-                    
-        self.anim_index += 1
-        self.after(450, self._animate_step)
+
+                # Highlight nodes
+                for node in [n1, n2]:
+                    r = node._radius
+                    self.canvas.create_oval(
+                        node.x - r - 2, node.y - r - 2,
+                        node.x + r + 2, node.y + r + 2,
+                        outline=self.COLOR_PATH_HILITE,
+                        width=3,
+                        fill='',
+                        tags="anim"
+                    )
+
+            self.anim_index += 1
+
+        if self.anim_index >= len(self.anim_steps):
+            self.animating = False
+            return
+        # Fixed cadence rather than after_idle, so a long path can't
+        # monopolize the idle queue and input events stay responsive
+        self.after(self.ANIM_TICK_MS, self._animate_step)
             
     def _clear_highlights(self):
         self.anim_steps = []
         self.active_path =[]
-        self.anim_index = 0 
+        self.anim_index = 0
         self.animating = False
-        self._redraw_all()
-            
-    def _bfs(self, start: str, goal: str, accessible_only: bool):
-            """ 
-            Breadth-First Search - finds shortest path by hop count. 
-            Explores level by level. 
-            """
-            from collections import deque
-            q = deque([start]) # Queue for BFS - FIFO 
-            parent: Dict[str, Optional[str]] = {start: None} # Trakc path for reconstruction
-            visited: Set[str] = {start} # Keep track of visited buildings 
-            visited_order: List[str] = [] # Order we visited buildings for the output 
-                
-            while q:
-                u = q.popleft() # Get next building fom front of queue 
-                visited_order.append(u)
-                    
-                # Found the destination 
-                if u == goal:
-                    break
-                    
-                # Check all neighboring buildings
-                for w in self.graph.neighbors(u, accessible_only):
-                    e = self.graph.get_edge(u, w)
-                    # Skip if path is closed or not accessible
-                    if not e or e.closed or (accessible_only and not e.accessible):
-                        continue 
-                    # If we heaven't visited this building yet 
-                    if w not in visited:
-                        visited.add(w)
-                        parent[w] = u # Remembering how we got here 
-                        q.append(w) # Add to queue to explore later
-                            
-                            
-            # Build the final path start to goal 
-            path = self._reconstruct_path(parent, start, goal)
-            return visited_order, path
+        self.canvas.delete("anim") # Only the overlay items, not the whole map
             
-    def _dfs(self, start: str, goal: str, accessible_only: bool):
-        """ 
-        Depth-First Search - explores as far as possible before backtracking.
-        Uses recursion (goes deep befor going wide)
-        """
-        visited: Set[str] = set()
-        visited_order: List[str] = []
-        parent: Dict[str, Optional[str]] = {start: None}
-        found = False # Flag to stop once e find the goal 
-            
-        def rec(u: str):
-            """REursive helper function to explore paths"""
-            nonlocal found # Access outer variable 
-            if found:
-                return # Already found path, stop searching
-                
-            visited.add(u)
-            visited_order.append(u)
-                
-            # Check if we reached the goal 
-            if u == goal:
-                found = True
-                return 
-                
-            # Try each neighbor (goes deep on first valid path)
-            for w in self.graph.neighbors(u, accessible_only):
-                e = self.graph.get_edge(u, w)
-                # Skip closed or inaccessible paths 
-                if not e or e.closed or (accessible_only and not e.accessible):
-                    continue
-                if w not in visited:
-                    parent[w] = u 
-                    rec(w) # Recursively explore this path 
-                        
-                        
-        # Start the recursive search 
-        rec(start)
-            
-        # Build the path if we found one 
-        path = self._reconstruct_path(parent, start, goal) if found else[]
-        return visited_order, path 
-        
-    def _reconstruct_path(self, parent: Dict[str, Optional[str]], start: str, goal: str) -> List[str]:
-        """Trace back from goal to start using parent pointers to build the path"""
-        if goal not in parent:
-            return[] # No path exists 
-            
-        # Build path backwards from goal to start
-        path = [goal]
-        cur = goal
-        while parent[cur] is not None:
-            cur = parent[cur]
-            path.append(cur)
-                
-        path.reverse() # Flip it to go start -> goal
-            
-        # Verify path starts at the right place 
-        return path if path and path[0] == start else []
-        
-    def _print_result(self, mode: str, visited_order: List[str], path: List[str]):
+    def _print_result(self, mode: str, visited_order: List[str], path: List[str],
+                      total_dist: float, total_time: float):
         """ Display the search results in the output box"""
         self.txt_output.delete("1.0", tk.END)
         self.txt_output.insert(tk.END, f"🔍 {mode} Traversal Order:\n")
         self.txt_output.insert(tk.END, " → ".join(visited_order) + "\n\n")
-            
+
         if path:
-            # Calculate total distance and time for the path 
-            total_dist = 0 
-            total_time = 0 
-                
-            for i in range(len(path) - 1):
-                e = self.graph.get_edge(path[i], path[i+1])
-                if e:
-                    total_dist += e.distance 
-                    total_time += e.time
-                        
+            # Totals were accumulated during the search itself
             self.txt_output.insert(tk.END, f"✓ {mode} Path ({len(path)-1} edges):\n")
             self.txt_output.insert(tk.END, " → ".join(path) + "\n\n")
             self.txt_output.insert(tk.END, f"📏 Distance: {int(total_dist)} meters\n")